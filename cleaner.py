@@ -8,14 +8,20 @@ import logging
 from json_formatter import JsonFormatter
 from decouple import config
 from tempora import parse_timedelta
-from random import sample
+from functools import lru_cache
+from random import randint, uniform
 from requests.exceptions import RequestException
+from urllib3.util import Retry
+from concurrent.futures import ThreadPoolExecutor
+import calendar
 import datetime
 import json
+import orjson
 import os
-from typing import Union
+from typing import Optional, Union
 import signal
 import sys
+import threading
 
 
 # Setup logging
@@ -36,28 +42,236 @@ log_level_mapping = {
 # Set the logger level
 logger.setLevel(log_level_mapping.get(os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO))
 
+# Lifetime annotations repeat across pods and runs, only parse each value once
+parse_lifetime = lru_cache(maxsize=256)(parse_timedelta)
+
+# Periods used by strfdelta_round(), their length in seconds and abbreviations
+PERIOD_NAMES = ("day", "hour", "minute", "second", "millisecond")
+PERIOD_SECONDS = (86400, 3600, 60, 1, 0.001)
+PERIOD_DESC = ("days", "hrs", "min", "sec", "msec")
+PERIOD_INDEX = {name: i for i, name in enumerate(PERIOD_NAMES)}
+
+# Maximum delay in seconds between retries after errors
+MAX_BACKOFF_SECONDS = 600
+
+# Seconds after which the API server closes a watch and it is re-established
+WATCH_TIMEOUT_SECONDS = 300
+
 def signal_handler(sig, frame):
     """Signal handler callback"""
     logger.warning("SIGINT received. Exiting.")
     sys.exit(0)
 
 
+@lru_cache(maxsize=8192)
 def parse_time(s: str):
-    """[summary]
+    """Parses a Kubernetes timestamp such as "2021-07-06T13:36:10Z".
+
+       The format is fixed, so slicing the fields is much faster than strptime().
 
     Args:
         s (str): The timestamp to parse.
 
     Returns:
-        float: POSIX timestamp as float
+        datetime.datetime: Timezone aware datetime in UTC
+    """
+    return datetime.datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]), tzinfo=datetime.timezone.utc)
+
+
+@lru_cache(maxsize=8192)
+def parse_timestamp(s: str):
+    """Parses a Kubernetes timestamp such as "2021-07-06T13:36:10Z" without
+       creating a datetime object.
+
+    Args:
+        s (str): The timestamp to parse.
+
+    Returns:
+        int: POSIX timestamp
+    """
+    return calendar.timegm((int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]), 0, 0, 0))
+
+
+def backoff_delay(backoff: float):
+    """Adds up to 50% random jitter to a retry delay, so that multiple replicas
+       don't retry in lockstep.
+
+    Args:
+        backoff (float): The retry delay in seconds
+
+    Returns:
+        float: The jittered delay in seconds, capped at MAX_BACKOFF_SECONDS
     """
-    return datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=datetime.timezone.utc)
+    return min(backoff + uniform(0, backoff / 2), MAX_BACKOFF_SECONDS)
+
 
+class WatchCacheQuery(pykube.query.Query):
+    """A pykube Query whose LIST requests are served from the API server's
+       watch cache instead of being read through from etcd.
+
+       Passing resourceVersion=0 allows the API server to answer from its
+       in-memory cache, which may be slightly stale but is much cheaper.
+    """
 
-def get_kubernetes_interface():
+    def execute(self, **kwargs):
+        params = kwargs.setdefault("params", {})
+        params.setdefault("resourceVersion", "0")
+        params.setdefault("resourceVersionMatch", "NotOlderThan")
+        return super().execute(**kwargs)
+
+
+class PodInformer(threading.Thread):
+    """Keeps an in-memory cache of pods in sync with the API server.
+
+       Pods are listed once and then kept up to date through a long-lived
+       watch, so only changes are transferred instead of the full pod list
+       on every iteration.
+    """
+
+    def __init__(self, api: pykube.HTTPClient, namespace, selector=None, field_selector=None, retry_interval: int = 60):
+        super().__init__(daemon=True)
+        self.api = api
+        self.namespace = namespace
+        self.selector = selector
+        self.field_selector = field_selector
+        self.retry_interval = retry_interval
+        self.query = WatchCacheQuery(api, pykube.Pod).filter(namespace=namespace, selector=selector, field_selector=field_selector)
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.synced = threading.Event()
+        self.error = None
+
+    def run(self):
+        resource_version = None
+        backoff = self.retry_interval
+        while True:
+            try:
+                if resource_version is None:
+                    resource_version = self.list()
+                    backoff = self.retry_interval
+                resource_version = self.watch(resource_version)
+            except Exception as err:
+                # Any error while listing or opening the watch, or e.g. a truncated watch event,
+                # must not end the thread and leave the cache frozen, so it is reported and the
+                # cache is re-listed
+                delay = backoff_delay(backoff)
+                logger.debug("Watching pods failed, re-listing in {:.0f}s: {}".format(delay, err))
+                self.error = err
+                resource_version = None
+                time.sleep(delay)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    def list(self):
+        """Replaces the cache with a fresh list of pods.
+
+        Returns:
+            str: The resource version of the list to start watching from
+        """
+        # The watch cache ignores limit for resourceVersion=0, so the list is not paginated
+        response = orjson.loads(self.query.execute().content)
+        resource_version = response["metadata"]["resourceVersion"]
+        cache = {obj["metadata"]["uid"]: obj for obj in response.get("items") or []}
+
+        with self.lock:
+            self.cache = cache
+        self.error = None
+        self.synced.set()
+        return resource_version
+
+    def watch(self, resource_version: str):
+        """Applies watch events to the cache until the API server closes the watch
+           or the connection drops.
+
+        Args:
+            resource_version (str): The resource version to start watching from
+
+        Returns:
+            None|str: None if the cache has to be re-listed, otherwise the resource version to resume from
+        """
+        params = {
+            "watch": "true",
+            "allowWatchBookmarks": "true",
+            "resourceVersion": resource_version,
+            "timeoutSeconds": WATCH_TIMEOUT_SECONDS,
+        }
+        if self.selector is not None:
+            params["labelSelector"] = pykube.query.as_selector(self.selector)
+        if self.field_selector is not None:
+            params["fieldSelector"] = pykube.query.as_selector(self.field_selector)
+
+        kwargs = {"url": "pods", "params": params, "stream": True, "timeout": WATCH_TIMEOUT_SECONDS + 30}
+        if self.namespace is not pykube.all:
+            kwargs["namespace"] = self.namespace
+
+        with self.api.get(**kwargs) as response:
+            self.api.raise_for_status(response)
+            try:
+                for line in response.iter_lines():
+                    event = orjson.loads(line)
+                    obj = event["object"]
+
+                    if event["type"] == "ERROR":
+                        # The resource version is too old, the cache has to be re-listed
+                        if obj.get("code") == 410:
+                            return None
+                        raise pykube.exceptions.HTTPError(obj.get("code"), obj.get("message"))
+
+                    resource_version = obj["metadata"]["resourceVersion"]
+                    if event["type"] == "BOOKMARK":
+                        continue
+
+                    with self.lock:
+                        if event["type"] == "DELETED":
+                            self.cache.pop(obj["metadata"]["uid"], None)
+                        else:
+                            self.cache[obj["metadata"]["uid"]] = obj
+            except RequestException as err:
+                # The connection dropped after the watch was established, e.g. during an API
+                # server restart, resume from the last event instead of re-listing
+                logger.debug("Watch connection lost, resuming from resource version {}: {}".format(resource_version, err))
+
+        return resource_version
+
+    def pods(self):
+        """Returns a snapshot of the cached pods.
+
+           The pods are plain decoded JSON objects, wrapping them in pykube.Pod
+           objects is left to the caller when needed, e.g. for deletion.
+
+        Returns:
+            list: List of pod dicts
+        """
+        with self.lock:
+            return list(self.cache.values())
+
+    def check(self, timeout: float):
+        """Waits for the initial list of pods and re-raises the last error
+           encountered while listing or watching.
+
+           Errors other than KubernetesError and RequestException are raised as
+           KubernetesError, so that they count towards the error limit.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for the initial list
+        """
+        self.synced.wait(timeout)
+        if not self.is_alive():
+            raise pykube.exceptions.KubernetesError("Pod informer stopped")
+
+        error = self.error
+        if isinstance(error, (pykube.exceptions.KubernetesError, RequestException)):
+            raise error
+        if error is not None:
+            raise pykube.exceptions.KubernetesError("Watching pods failed: {!r}".format(error)) from error
+
+
+def get_kubernetes_interface(concurrency: int = 8):
     """Retrieves a pykube.HTTPClient interface either from a service account or, for
        local development, from the user's ~/.kube/config.
 
+    Args:
+        concurrency (int, optional): Number of concurrent requests to keep connections for. Defaults to 8.
+
     Returns:
         pykube.HTTPClient: A pykube.HTTPClient interface
     """
@@ -68,7 +282,11 @@ def get_kubernetes_interface():
         config = pykube.KubeConfig.from_file(os.path.expanduser("~/.kube/config"))
         logger.debug("Using local ~/.kube/config for authentication")
 
-    return pykube.HTTPClient(config)
+    # Keep enough connections alive for the watch, the list and the concurrent requests
+    # and retry requests that failed to connect
+    http_adapter = pykube.http.KubernetesHTTPAdapter(config, pool_connections=4, pool_maxsize=max(32, concurrency + 2), max_retries=Retry(connect=3, read=0, backoff_factor=0.3))
+
+    return pykube.HTTPClient(config, http_adapter=http_adapter)
 
 
 def container_finish_time(status):
@@ -76,41 +294,53 @@ def container_finish_time(status):
     if terminated_state:
         finish_time = terminated_state.get("finishedAt")
         if finish_time:
-            return parse_time(finish_time).timestamp()
+            return parse_timestamp(finish_time)
 
 
-def entity_termination_time(entity: Union[pykube.objects.Pod, pykube.objects.Job]):
+def entity_termination_time(obj: dict):
     """Determines the termination time of an enity.
 
     Args:
-        eentity (pykube.objects.Pod, pykube.objects.Job): The entity to inspect.
+        obj (dict): The decoded Pod or Job object to inspect.
 
     Returns:
         None|int: None if the termination time cannot be determined, a time offset in seconds otherwise
     """
-    pod_status = entity.obj.get("status")
-    container_statuses = pod_status.get("initContainerStatuses", []) + pod_status.get("containerStatuses", [])
-    finish_times = list(filter(None, (container_finish_time(status) for status in container_statuses)))
-    if not finish_times:
-        return None
-    return max(finish_times)
+    pod_status = obj.get("status")
+
+    # Native sidecars are init containers with restartPolicy Always, they are only stopped
+    # after the containers finished, so the latest finish time across both lists is needed
+    init_containers = obj.get("spec", {}).get("initContainers", [])
+    if any(container.get("restartPolicy") == "Always" for container in init_containers):
+        statuses = pod_status.get("containerStatuses", []) + pod_status.get("initContainerStatuses", [])
+        return max(filter(None, (container_finish_time(status) for status in statuses)), default=None)
+
+    # Otherwise containers only start after all init containers finished, so init containers
+    # only need to be inspected if no container finish time is known
+    for key in ("containerStatuses", "initContainerStatuses"):
+        finish_time = max(filter(None, (container_finish_time(status) for status in pod_status.get(key, []))), default=None)
+        if finish_time is not None:
+            return finish_time
+
+    return None
 
 
-def is_entity_expired(entity: Union[pykube.objects.Pod, pykube.objects.Job], max_age_seconds: int):
+def is_entity_expired(obj: dict, max_age_seconds: int, now: Optional[float] = None):
     """Compares the age since termination to max_age_seconds and determines whether
        the entity is expired.
 
     Args:
-        entity (pykube.objects.Pod, pykube.objects.Job): The entity to inspect.
+        obj (dict): The decoded Pod or Job object to inspect.
         max_age_seconds (int): Maximum allowed age of the entity.
+        now (float, optional): POSIX timestamp to compare against. Defaults to the current time.
 
     Returns:
         None|int: None if the entity is not expired, otherwise the age in seconds.
     """
 
     # If we cannot determine the finish time, use start time instead
-    finish_time = (entity_termination_time(entity) or parse_time(entity.obj.get("metadata").get("creationTimestamp")).timestamp())
-    seconds_since_completion = time.time() - finish_time
+    finish_time = (entity_termination_time(obj) or parse_timestamp(obj.get("metadata").get("creationTimestamp")))
+    seconds_since_completion = (time.time() if now is None else now) - finish_time
 
     if seconds_since_completion > max_age_seconds:
         return int(seconds_since_completion)
@@ -119,22 +349,34 @@ def is_entity_expired(entity: Union[pykube.objects.Pod, pykube.objects.Job], max
     return None
 
 
-def delete_entity(entity: Union[pykube.objects.Pod, pykube.objects.Job], max_age_seconds: int, dry_run: bool = False):
-    """Delete an entity if it's older than a given max age and dry run is disabled.
+def delete_entity(entity: Union[pykube.objects.Pod, pykube.objects.Job], entity_age: int, dry_run: bool = False):
+    """Delete an expired entity if dry run is disabled.
 
     Args:
         entity (pykube.objects.Pod, pykube.objects.Job): The entity to delete.
-        max_age_seconds (int): The maximum allowed age of the entity in seconds.
+        entity_age (int): The age of the entity in seconds, as returned by is_entity_expired().
         dry_run (bool, optional): Whether this is a dry run. Defaults to False.
 
     Returns:
         bool: Whether the entity was deleted
     """
 
-    # Verify if the entity is expired and can be deleted
-    entity_age = is_entity_expired(entity, max_age_seconds)
-    if entity_age == None:
-        return False
+    log_entity_deletion(entity, entity_age, dry_run)
+
+    if dry_run == False:
+        return entity.delete()
+
+    return False
+
+
+def log_entity_deletion(entity: Union[pykube.objects.Pod, pykube.objects.Job], entity_age: int, dry_run: bool = False):
+    """Logs the deletion of an entity.
+
+    Args:
+        entity (pykube.objects.Pod, pykube.objects.Job): The entity that is deleted.
+        entity_age (int): The age of the entity in seconds.
+        dry_run (bool, optional): Whether this is a dry run. Defaults to False.
+    """
 
     # Prepare message if this is a dry run
     dry_run_message = "[DRY RUN] " if dry_run else ""
@@ -149,10 +391,122 @@ def delete_entity(entity: Union[pykube.objects.Pod, pykube.objects.Job], max_age
         "age": entity_age
      })
 
-    if dry_run == False:
-        return entity.delete()
 
-    return False
+def is_controller_active(api: pykube.HTTPClient, namespace: str, owner_reference: dict):
+    """Determines whether the controller of a pod may still create pods.
+
+       Only Jobs can be checked for completion, any other controller is considered active.
+
+    Args:
+        api (pykube.HTTPClient): The Kubernetes API client.
+        namespace (str): The namespace of the pod.
+        owner_reference (dict): The controller owner reference of the pod.
+
+    Returns:
+        bool: False if the controller is a Job that finished or no longer exists, True otherwise
+    """
+    if owner_reference.get("kind") != "Job":
+        return True
+
+    try:
+        job = pykube.Job.objects(api, namespace=namespace).get_by_name(owner_reference["name"])
+    except pykube.exceptions.ObjectDoesNotExist:
+        return False
+
+    if job.obj["metadata"].get("uid") != owner_reference.get("uid"):
+        return False
+
+    conditions = job.obj.get("status", {}).get("conditions") or []
+    return not any(condition.get("type") in ("Complete", "Failed") and condition.get("status") == "True" for condition in conditions)
+
+
+def group_victims_by_labels(api: pykube.HTTPClient, victims: list, pods: list, label_selector: str = "", field_selector: str = ""):
+    """Groups expired pods that can be deleted with a single delete collection request.
+
+       Pods are grouped by namespace, phase and labels. A group is only batched if it has
+       more than one pod and no other pod in the same namespace and phase carries the same
+       labels, so that selecting the group's labels and phase deletes exactly its pods.
+
+       The delete collection request is evaluated against the pods on the API server, so it
+       also deletes matching pods that entered the phase after the scan. Groups with pods
+       owned by an active controller, which may create more pods with the same labels, are
+       therefore not batched.
+
+    Args:
+        api (pykube.HTTPClient): The Kubernetes API client.
+        victims (list): List of (pykube.Pod, age) tuples of expired pods to delete.
+        pods (list): List of all pod dicts the victims were selected from.
+        label_selector (str, optional): Label selector the pods were selected with. Defaults to "".
+        field_selector (str, optional): Field selector the pods were selected with. Defaults to "".
+
+    Returns:
+        (list, list): List of (namespace, label selector, field selector, [(pykube.Pod, age), ...]) batches
+                      and the list of remaining (pykube.Pod, age) victims to delete one by one
+    """
+
+    # Index the labels of all pods by namespace and phase
+    pod_labels = {}
+    for pod in pods:
+        pod_labels.setdefault((pod["metadata"]["namespace"], pod["status"].get("phase")), []).append(pod["metadata"].get("labels") or {})
+
+    groups = {}
+    remaining = []
+    for entity, entity_age in victims:
+        labels = entity.obj["metadata"].get("labels")
+        if not labels:
+            remaining.append((entity, entity_age))
+            continue
+
+        key = (entity.namespace, entity.obj["status"].get("phase"), frozenset(labels.items()))
+        groups.setdefault(key, []).append((entity, entity_age))
+
+    # Remember the state of each controller, so that it is only looked up once
+    active_controllers = {}
+
+    def has_active_controller(entity):
+        for owner_reference in entity.obj["metadata"].get("ownerReferences") or []:
+            if owner_reference.get("controller"):
+                uid = owner_reference.get("uid")
+                if uid not in active_controllers:
+                    active_controllers[uid] = is_controller_active(api, entity.namespace, owner_reference)
+                if active_controllers[uid]:
+                    return True
+        return False
+
+    batches = []
+    for (namespace, phase, labels), group in groups.items():
+        matching_pods = sum(1 for other_labels in pod_labels.get((namespace, phase), []) if labels.issubset(other_labels.items()))
+        if len(group) > 1 and matching_pods == len(group) and not any(has_active_controller(entity) for entity, entity_age in group):
+            batch_label_selector = ",".join(["{}={}".format(key, value) for key, value in sorted(labels)] + ([label_selector] if label_selector else []))
+            batch_field_selector = ",".join(["status.phase={}".format(phase)] + ([field_selector] if field_selector else []))
+            batches.append((namespace, batch_label_selector, batch_field_selector, group))
+        else:
+            remaining.extend(group)
+
+    return batches, remaining
+
+
+def delete_entity_collection(api: pykube.HTTPClient, namespace: str, label_selector: str, field_selector: str, entities: list, dry_run: bool = False):
+    """Delete all pods matching the given selectors in a namespace with a single request.
+
+    Args:
+        api (pykube.HTTPClient): The Kubernetes API client.
+        namespace (str): The namespace of the pods.
+        label_selector (str): Label selector matching exactly the pods to delete.
+        field_selector (str): Field selector matching exactly the pods to delete.
+        entities (list): List of (pykube.Pod, age) tuples of the pods that are deleted.
+        dry_run (bool, optional): Whether this is a dry run. Defaults to False.
+    """
+    for entity, entity_age in entities:
+        log_entity_deletion(entity, entity_age, dry_run)
+
+    if dry_run == False:
+        response = api.delete(url="pods", namespace=namespace, params={
+            "labelSelector": label_selector,
+            "fieldSelector": field_selector,
+            "propagationPolicy": "Background"
+        })
+        api.raise_for_status(response)
 
 
 def parse_deletion_status(status: str):
@@ -179,6 +533,38 @@ def parse_deletion_status(status: str):
     return phase, reason
 
 
+def match_label_selector(labels: dict, selector: dict):
+    """Checks whether labels match a label selector in the format accepted by pykube,
+       e.g. {"app": "api", "tier__in": ["web", "db"]}.
+
+    Args:
+        labels (dict): The labels of the object to check
+        selector (dict): The label selector with optional eq, neq, in and notin operators
+
+    Returns:
+        bool: Whether the labels match all terms of the selector
+    """
+    for key, value in selector.items():
+        label, _, op = key.partition("__")
+        label_value = labels.get(label)
+        if op in ("", "eq"):
+            if label_value != str(value):
+                return False
+        elif op == "neq":
+            if label_value == str(value):
+                return False
+        elif op == "in":
+            if label_value not in value:
+                return False
+        elif op == "notin":
+            if label_value in value:
+                return False
+        else:
+            raise ValueError(f"{op} is not a valid comparison operator")
+
+    return True
+
+
 def strfdelta_round(tdelta, round_period="second"):
     """Returns a human readable string representation of a timedelta object.
 
@@ -189,28 +575,27 @@ def strfdelta_round(tdelta, round_period="second"):
     Returns:
         str: A human readable string representation of the timedelta object
     """
-    period_names = ("day", "hour", "minute", "second", "millisecond")
-    if round_period not in period_names:
-        raise ValueError(f'round_period "{round_period}" invalid, should be one of {",".join(period_names)}')
-    period_seconds = (86400, 3600, 60, 1, 1 / pow(10, 3))
-    period_desc = ("days", "hrs", "min", "sec", "msec")
-    round_i = period_names.index(round_period)
-
-    s = ""
     remainder = tdelta.total_seconds()
-    for i in range(len(period_names)):
-        q, remainder = divmod(remainder, period_seconds[i])
+
+    # Fast path for the default rounding period
+    if round_period == "second":
+        days, remainder = divmod(remainder, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, remainder = divmod(remainder, 60)
+        seconds = remainder // 1
+        return " ".join([f"{q:.0f}{desc}" for q, desc in ((days, "days"), (hours, "hrs"), (minutes, "min"), (seconds, "sec")) if int(q) > 0])
+
+    round_i = PERIOD_INDEX.get(round_period)
+    if round_i is None:
+        raise ValueError(f'round_period "{round_period}" invalid, should be one of {",".join(PERIOD_NAMES)}')
+
+    parts = []
+    for i in range(round_i + 1):
+        q, remainder = divmod(remainder, PERIOD_SECONDS[i])
         if int(q) > 0:
-            if len(s) != 0:
-                s += " "
-            s += f"{q:.0f}{period_desc[i]}"
-        if i == round_i:
-            break
-        if i == round_i + 1:
-            s += f"{remainder}{period_desc[round_i]}"
-            break
+            parts.append(f"{q:.0f}{PERIOD_DESC[i]}")
 
-    return s
+    return " ".join(parts)
 
 
 def main():
@@ -240,6 +625,12 @@ def main():
         default=pykube.all,
         help="Limit the scope to a single namespace [default: all namespaces]",
     )
+    parser.add_argument(
+        "--node-name",
+        type=str,
+        default=config("K8S_NODE_NAME", default=None),
+        help="Limit the scope to pods on a single node [default: $K8S_NODE_NAME or all nodes]",
+    )
     parser.add_argument(
         "-u",
         "--user",
@@ -297,6 +688,18 @@ def main():
         default=5,
         help="How many consecutive errors [default: 5] are allowed before exiting",
     )
+    parser.add_argument(
+        "--delete-concurrency",
+        type=int,
+        default=8,
+        help="How many pods [default: 8] are deleted concurrently",
+    )
+    parser.add_argument(
+        "--batch-delete",
+        action="store_true",
+        default=False,
+        help="Delete pods that share a unique set of labels with a single request. The request also deletes matching pods that entered the same phase after the scan, without a grace period",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -322,49 +725,134 @@ def main():
     })
 
     # Get a Kubernetes API instance
-    kubectl = get_kubernetes_interface()
-
-    # Start error counter
+    kubectl = get_kubernetes_interface(args.delete_concurrency)
+
+    # Per-pod debug messages are only built if they are actually logged
+    verbose = not args.quiet and logger.isEnabledFor(logging.DEBUG)
+
+    # Parse the requested deletion statuses into a map of phase to accepted reasons,
+    # where a reason of None accepts any reason
+    status_map: dict[str, list[Optional[str]]] = {}
+    for deletion_status in args.status:
+        phase, reason = parse_deletion_status(deletion_status)
+        status_map.setdefault(phase, []).append(reason)
+
+    # Parse the label selector once
+    label_selector = json.loads(args.label_selector)
+
+    # Watch all pods ...
+    # - in the specified namespace and
+    # - on the specified node (e.g. when running as a DaemonSet)
+    # The --label-selector argument only applies to status based deletion and is matched
+    # during the scan, so that lifetime annotations are enforced on all pods.
+    node_field_selector = "spec.nodeName={}".format(args.node_name) if args.node_name else None
+    informer = PodInformer(kubectl, args.namespace, field_selector=node_field_selector, retry_interval=args.interval)
+    informer.start()
+
+    # Thread pool to delete pods concurrently
+    executor = ThreadPoolExecutor(max_workers=args.delete_concurrency)
+
+    # Start error counter and retry delay
     errorcount = 0
+    backoff = args.interval
 
     # Main application loop
     while True:
         pod_deletion_counter = 0
         job_deletion_counter = 0
 
-        # Get all pods ...
-        # - in the specified namespace
-        # - that are not in 'Running' state and
-        # - that match the --label-selector argument
         try:
+            informer.check(args.interval)
+
+            # Use the same point in time for all pods in this run
+            now_utc = datetime.datetime.now(datetime.timezone.utc)
+            now = now_utc.timestamp()
+
+            # Non-running pods are deleted based on their phase, running pods are killed based
+            # on their lifetime. Only a uniform random sample of at most --lifetime-max-kills
+            # expired pods is kept (reservoir sampling).
+            victims = []
+            expired_pods = []
+            expired_count = 0
+            pods = informer.pods()
+            for pod in pods:
+
+                # Retrieve pod metadata and status object containing reason etc.
+                pod_metadata = pod["metadata"]
+                pod_status = pod["status"]
+                pod_name = pod_metadata["name"]
+                pod_namespace = pod_metadata["namespace"]
+
+                if pod_status.get("phase") == "Running":
+                    pod_annotations = pod_metadata.get("annotations", {})
+                    if args.lifetime_annotation in pod_annotations:
+                        pod_annotated_lifetime = pod_annotations.get(args.lifetime_annotation, "")
+                        pod_age = now_utc - parse_time(pod_metadata.get("creationTimestamp"))
+
+                        try:
+                            pod_annotated_lifetime_timedelta = parse_lifetime(pod_annotated_lifetime)
+                            if pod_age > pod_annotated_lifetime_timedelta:
+                                if verbose:
+                                    logger.debug(f"Pod {pod_name} in {pod_namespace} namespace has '{args.lifetime_annotation}' annotation of {pod_annotated_lifetime} and will be considered for termination (actual age {strfdelta_round(pod_age)})")
+                                if args.skip_with_owner and pod_metadata.get("ownerReferences"):
+                                    if verbose:
+                                        logger.debug(f"Skipping pod with owner reference {pod_name} in {pod_namespace} namespace")
+                                    continue
+
+                                # Keep the age and lifetime for the kill loop
+                                expired_pod = (pod, pod_age, pod_annotated_lifetime)
+                                if len(expired_pods) < args.lifetime_max_kills:
+                                    expired_pods.append(expired_pod)
+                                else:
+                                    j = randint(0, expired_count)
+                                    if j < args.lifetime_max_kills:
+                                        expired_pods[j] = expired_pod
+                                expired_count += 1
 
-            # Select pods to delete based on their phase and user specified selectors
-            for pod in pykube.Pod.objects(kubectl).filter(namespace=args.namespace, field_selector="status.phase!=Running", selector=json.loads(args.label_selector)):
+                        except (TypeError, ValueError) as err:
+                            print("Pod {} in {} namespace has '{}' annotation with value '{}' but it cannot be parsed: {}".format(pod_name, pod_namespace, args.lifetime_annotation, pod_annotated_lifetime, err), file=sys.stderr)
+                    continue
 
-                # Retrieve pod status object containing reason etc.
-                pod_status = pod.obj["status"]
+                # Only consider pods matching the --label-selector argument
+                if label_selector and not match_label_selector(pod_metadata.get("labels") or {}, label_selector):
+                    continue
 
                 # Preempting pods don't have any container information, delete immediately
                 if pod_status.get("reason") == "Preempting":
-                    delete_entity(pod, 0, args.dry_run)
-                    pod_deletion_counter += 1
-
-                # Loop over all requested deletion statuses...
-                for deletion_status in args.status:
-                    phase, reason = parse_deletion_status(deletion_status)
-
-                    if pod_status.get("phase") == phase:
-                        if reason == None or pod_status.get("reason") == reason:
-                            if pod.namespace == "kube-system" and args.user == True:
-                                if not args.quiet:
-                                    logger.debug("Skipping system pod {} in {} namespace".format(pod.name, pod.namespace))
-                            else:
-                                if args.skip_with_owner and pod.metadata.get("ownerReferences"):
-                                    if not args.quiet:
-                                        logger.debug("Skipping pod with owner reference {} in {} namespace".format(pod.name, pod.namespace))
-                                    continue
-                                delete_entity(pod, args.graceperiod, args.dry_run)
-                                pod_deletion_counter += 1
+                    pod_age = is_entity_expired(pod, 0, now)
+                    if pod_age is not None:
+                        victims.append((pykube.Pod(kubectl, pod), pod_age))
+                    continue
+
+                # Only consider pods matching one of the requested deletion statuses
+                reasons = status_map.get(pod_status.get("phase"))
+                if reasons is None or (None not in reasons and pod_status.get("reason") not in reasons):
+                    continue
+
+                if pod_namespace == "kube-system" and args.user == True:
+                    if verbose:
+                        logger.debug(f"Skipping system pod {pod_name} in {pod_namespace} namespace")
+                    continue
+
+                if args.skip_with_owner and pod_metadata.get("ownerReferences"):
+                    if verbose:
+                        logger.debug(f"Skipping pod with owner reference {pod_name} in {pod_namespace} namespace")
+                    continue
+
+                # Only wrap pods that are past the grace period and will be deleted
+                pod_age = is_entity_expired(pod, args.graceperiod, now)
+                if pod_age is not None:
+                    victims.append((pykube.Pod(kubectl, pod), pod_age))
+
+            pod_deletion_counter += len(victims)
+
+            # Delete groups of pods that are uniquely identified by their labels with a single request
+            if args.batch_delete:
+                batches, victims = group_victims_by_labels(kubectl, victims, pods, pykube.query.as_selector(label_selector), node_field_selector)
+                list(executor.map(lambda batch: delete_entity_collection(kubectl, *batch, args.dry_run), batches))
+
+            # Delete the remaining selected pods concurrently
+            list(executor.map(lambda victim: delete_entity(victim[0], victim[1], args.dry_run), victims))
 
             # Sleep 15 seconds before running the next iteration.
             if not args.quiet or (pod_deletion_counter > 0 or job_deletion_counter > 0):
@@ -373,38 +861,13 @@ def main():
                     "jobs": job_deletion_counter
                 })
 
-            # Select pods to be killed based on their lifetime.
-            expired_pods = []
-            for pod in pykube.Pod.objects(kubectl).filter(namespace=args.namespace, field_selector="status.phase==Running"):
-
-                # Retrieve pod status object containing reason etc.
-                if args.lifetime_annotation in pod.annotations:
-                    pod_annotated_lifetime = pod.annotations.get(args.lifetime_annotation, "")
-                    pod_creation_timestamp = parse_time(pod.metadata.get("creationTimestamp"))
-
-                    try:
-                        pod_annotated_lifetime_timedelta = parse_timedelta(pod_annotated_lifetime)
-                        if (datetime.datetime.now().astimezone() - pod_creation_timestamp) > pod_annotated_lifetime_timedelta:
-                            if not args.quiet:
-                                logger.debug("Pod {} in {} namespace has '{}' annotation of {} and will be considered for termination (actual age {})".format(pod.name, pod.namespace, args.lifetime_annotation, pod_annotated_lifetime, strfdelta_round(datetime.datetime.now().astimezone() - pod_creation_timestamp)))
-                            if args.skip_with_owner and pod.metadata.get("ownerReferences"):
-                                if not args.quiet:
-                                    logger.debug("Skipping pod with owner reference {} in {} namespace".format(pod.name, pod.namespace))
-                                continue
-
-                            expired_pods.append(pod)
-
-                    except (TypeError, ValueError) as err:
-                        print("Pod {} in {} namespace has '{}' annotation with value '{}' but it cannot be parsed: {}".format(pod.name, pod.namespace, args.lifetime_annotation, pod_annotated_lifetime, err), file=sys.stderr)
-
-            if len(expired_pods) > 0:
+            if expired_count > 0:
                 if not args.quiet:
-                    print("Found {} expired pods, killing a maximum of {} during this run.".format(len(expired_pods), args.lifetime_max_kills))
-                for pod in sample(expired_pods, min(len(expired_pods), args.lifetime_max_kills)):
+                    print("Found {} expired pods, killing a maximum of {} during this run.".format(expired_count, args.lifetime_max_kills))
+                for obj, pod_age, pod_annotated_lifetime in expired_pods:
+                    pod = pykube.Pod(kubectl, obj)
                     dry_run_message = "[DRY RUN] " if args.dry_run else ""
-                    pod_annotated_lifetime = pod.annotations.get(args.lifetime_annotation, "")
-                    pod_creation_timestamp = parse_time(pod.metadata.get("creationTimestamp"))
-                    print("{}Deleting pod {} in namespace {} because its age of {} exceeds the maximum age of {}.".format(dry_run_message, pod.name, pod.namespace, strfdelta_round(datetime.datetime.now().astimezone() - pod_creation_timestamp), pod_annotated_lifetime))
+                    print("{}Deleting pod {} in namespace {} because its age of {} exceeds the maximum age of {}.".format(dry_run_message, pod.name, pod.namespace, strfdelta_round(pod_age), pod_annotated_lifetime))
 
                     if args.dry_run == False:
                         pod.delete()
@@ -412,16 +875,19 @@ def main():
             # Sleep for the given interval
             time.sleep(args.interval)
 
-            # Reset error counter
+            # Reset error counter and retry delay
             errorcount = 0
+            backoff = args.interval
 
         except pykube.exceptions.KubernetesError as err:
             print("KubernetesError: {0}".format(err), file=sys.stderr)
-            time.sleep(args.interval*1.5)
+            time.sleep(backoff_delay(backoff))
+            backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
             errorcount += 1
         except RequestException as err:
             print("RequestException: {0}".format(str(err)), file=sys.stderr)
-            time.sleep(args.interval*1.5)
+            time.sleep(backoff_delay(backoff))
+            backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
             errorcount += 1
         finally:
             if errorcount >= args.error_limit:
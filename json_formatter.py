@@ -1,5 +1,5 @@
 from pythonjsonlogger import jsonlogger
-import json
+import orjson
 
 DATE_FORMAT_TIMEZONE = "%Y-%m-%dT%H:%M:%S.%fZ"
 
@@ -31,21 +31,15 @@ class JsonFormatter(jsonlogger.JsonFormatter):
         Add the extra data to the log record.
         prefix will be added to all custom tags.
         """
-        record_items = list(record.__dict__.items())
-        records_filtered_reserved = [item for item in record_items if item[0] not in reserved]
-        records_filtered_private_attr = [item for item in records_filtered_reserved if
-                                         not JsonFormatter.is_private_key(item[0]) and item[0] != "taskName"]
-
-
-        log_record.setdefault('extra', {})
-
-        for key, value in records_filtered_private_attr:
-            if not JsonFormatter.is_extra_key(key):
-                if isinstance(value, (dict, list)):
-                    value = json.dumps(value)
-                log_record["extra"][key] = value
-                log_record.pop(key, None)
-
-        # Delete log_record["extra"] if it's empty
-        if not log_record["extra"]:
-            del log_record["extra"]
+        extras = {}
+        for key, value in record.__dict__.items():
+            if key in reserved or key == "taskName" or key.startswith(("_", JsonFormatter.EXTRA_PREFIX)):
+                continue
+            if isinstance(value, (dict, list)):
+                value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+            extras[key] = value
+            log_record.pop(key, None)
+
+        # Only add log_record["extra"] if there is any extra data
+        if extras:
+            log_record.setdefault("extra", {}).update(extras)